@@ -21,6 +21,7 @@ import numpy as np
 from numpy import genfromtxt
 
 from example_simulator_functions import park91a_hifi
+from example_simulator_functions.park91a import unit_bounding
 
 
 def park91a_hifi_coords(x1, x2, x3, x4):
@@ -42,11 +43,12 @@ def park91a_hifi_coords(x1, x2, x3, x4):
     Args:
         x1 (float): Input parameter 1 [0,1)
         x2 (float): Input parameter 2 [0,1)
-        x3 (float): Input parameter 3 [0,1)
-        x4 (float): Input parameter 4 [0,1)
+        x3 (float, np.ndarray): Input parameter 3 [0,1)
+        x4 (float, np.ndarray): Input parameter 4 [0,1)
 
     Returns:
-        float: Value of function at parameters
+        y (float, np.ndarray): Value of function at parameters
+        gradient (tuple): Gradients of the function w.r.t. *x1* and *x2*
 
     References:
         [1] Park, J.-S.(1991). Tuning complex computer codes to data and optimal
@@ -61,26 +63,7 @@ def park91a_hifi_coords(x1, x2, x3, x4):
             http://doi.org/10.1080/00401706.2012.723572
     """
     # catch values outside of definition
-    if x1 <= 0:
-        x1 = 0.01
-    elif x1 >= 1:
-        x1 = 0.99
-
-    if x2 <= 0:
-        x2 = 0.01
-    elif x2 >= 1:
-        x2 = 0.99
-
-    if x3 <= 0:
-        x3 = 0.01
-    elif x3 >= 1:
-        x3 = 0.99
-
-    if x4 <= 0:
-        x4 = 0.01
-    elif x4 >= 1:
-        x4 = 0.99
-
+    x1, x2, x3, x4 = unit_bounding(x1, x2, x3, x4)
     return park91a_hifi(x1, x2, x3, x4, gradient_bool=True)
 
 
@@ -130,12 +113,8 @@ def run_type_standard(x3_vec, x4_vec, params):
         y_vec (np.array): Vector of function values at grid points
         y_grad (np.array): Empty dummy vector of gradient values at grid points
     """
-    y_vec = []
-    y_grad = []
-    for x3, x4 in zip(x3_vec, x4_vec):
-        y_vec.append(park91a_hifi_coords(params["x1"], params["x2"], x3, x4)[0])
-    y_vec = np.array(y_vec)
-    y_grad = np.array(y_grad)
+    y_vec, _ = park91a_hifi_coords(params["x1"], params["x2"], x3_vec, x4_vec)
+    y_grad = np.array([])
     return y_vec, y_grad
 
 
@@ -151,13 +130,8 @@ def run_type_provided_gradient(x3_vec, x4_vec, params):
         y_vec (np.array): Vector of function values at grid points
         y_grad (np.array): Vector of gradient values at grid points
     """
-    y_vec = []
-    y_grad = []
-    for x3, x4 in zip(x3_vec, x4_vec):
-        y_vec.append(park91a_hifi_coords(params["x1"], params["x2"], x3, x4)[0])
-        y_grad.append(park91a_hifi_coords(params["x1"], params["x2"], x3, x4)[1][:])
-    y_vec = np.array(y_vec)
-    y_grad = np.array(y_grad).T
+    y_vec, gradient = park91a_hifi_coords(params["x1"], params["x2"], x3_vec, x4_vec)
+    y_grad = np.array(gradient)
     return y_vec, y_grad
 
 
@@ -173,10 +147,7 @@ def run_type_adjoint(x3_vec, x4_vec, params):
         y_vec (np.array): Empty dummy vector of function values at grid points
         do_dx (np.array): Vector of gradient values of the objective function at grid points
     """
-    y_vec = []
-    y_grad = []
-    for x3, x4 in zip(x3_vec, x4_vec):
-        y_grad.append(park91a_hifi_coords(params["x1"], params["x2"], x3, x4)[1][:])
+    _, gradient = park91a_hifi_coords(params["x1"], params["x2"], x3_vec, x4_vec)
 
     # we define g(y,x1,x2) = y - term1 - term2 = 0
     # as y is explicit in g, dg_dy = 1:
@@ -192,11 +163,11 @@ def run_type_adjoint(x3_vec, x4_vec, params):
     # afterwards we can calculate the final gradient do_dx, the gradient of the objective fun
     # w.r.t. to the model input x; for this simple analytical example g_x is simply the
     # negative gradient/jacobian of the model (for PDEs)
-    dg_dx = -np.array(y_grad)
+    dg_dx = -np.array(gradient).T
 
     # now we can finalize the adjoint:
     do_dx = np.array(np.dot(lambda_var, dg_dx))
-    y_vec = np.array(y_vec)
+    y_vec = np.array([])
 
     return y_vec, do_dx
 
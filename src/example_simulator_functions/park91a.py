@@ -19,8 +19,8 @@ import numpy as np
 # x3 and x4 grid
 X = np.linspace(0, 1, 4)
 X3, X4 = np.meshgrid(X, X)
-X3 = X3.flatten()
-X4 = X4.flatten()
+X3 = X3.ravel()
+X4 = X4.ravel()
 
 
 def unit_bounding(*args):
@@ -28,13 +28,7 @@ def unit_bounding(*args):
 
     This should be avoided...
     """
-    args = list(args)
-    for i, arg in enumerate(args):
-        if arg <= 0:
-            args[i] = 0.01
-        elif arg >= 1:
-            args[i] = 0.99
-    return tuple(args)
+    return tuple(np.where(arg <= 0, 0.01, np.where(arg >= 1, 0.99, arg)) for arg in args)
 
 
 def x3_x4_grid_eval(park_function, x1, x2, gradient_bool=False):
@@ -49,24 +43,12 @@ def x3_x4_grid_eval(park_function, x1, x2, gradient_bool=False):
     Returns:
         np.ndarray: *park_function* evaluated on the grid
     """
-    # Loop over the coordinates
-    y_vec = []
-    dy_dx1_vec = []
-    dy_dx2_vec = []
+    # Bound the arguments and evaluate on the whole grid at once
+    args = unit_bounding(x1, x2, X3, X4)
     if gradient_bool:
-        for x3, x4 in zip(X3, X4):
-            # Bound the arguments
-            args = unit_bounding(x1, x2, x3, x4)
-            y, gradient = park_function(*args, gradient_bool=True)
-            dy_dx1_vec.append(gradient[0])
-            dy_dx2_vec.append(gradient[1])
-            y_vec.append(y)
-        return np.array(y_vec), (np.array(dy_dx1_vec), np.array(dy_dx2_vec))
-    for x3, x4 in zip(X3, X4):
-        # Bound the arguments
-        args = unit_bounding(x1, x2, x3, x4)
-        y_vec.append(park_function(*args))
-    return np.array(y_vec)
+        y_vec, (dy_dx1_vec, dy_dx2_vec) = park_function(*args, gradient_bool=True)
+        return y_vec, (dy_dx1_vec, dy_dx2_vec)
+    return park_function(*args)
 
 
 def park91a_lofi(x1, x2, x3, x4, gradient_bool=False):
@@ -16,7 +16,7 @@
 
 import numpy as np
 from numpy.typing import ArrayLike
-from scipy.stats import multinomial
+from scipy.special import gammaln, xlogy
 
 from queens.distributions._distribution import Discrete
 from queens.utils.logger_settings import log_init_args
@@ -41,9 +41,8 @@ class Multinomial(Discrete):
         probabilities_array = np.array(probabilities)
 
         # we misuse the sample_space attribute of the base class to store the number of trials
-        sample_space = np.ones((len(probabilities_array), 1)) * self.n_trials
+        sample_space = np.full((len(probabilities_array), 1), self.n_trials)
         super().__init__(probabilities_array, sample_space, dimension=len(probabilities_array))
-        self.scipy_multinomial = multinomial(self.n_trials, self.probabilities)
 
     def _compute_mean_and_covariance(self) -> tuple[np.ndarray, np.ndarray]:
         """Compute the mean value and covariance of the mixture model.
@@ -54,9 +53,8 @@ class Multinomial(Discrete):
         """
         n_trials = self.sample_space[0]
         mean = n_trials * self.probabilities
-        covariance = n_trials * (
-            np.diag(self.probabilities) - np.outer(self.probabilities, self.probabilities)
-        )
+        covariance = -n_trials * np.outer(self.probabilities, self.probabilities)
+        covariance[np.diag_indices_from(covariance)] += mean
         return mean, covariance
 
     def draw(self, num_draws: int = 1) -> np.ndarray:
@@ -79,7 +77,17 @@ class Multinomial(Discrete):
         Returns:
             Log-PMF at positions
         """
-        return self.scipy_multinomial.logpmf(x)
+        # Evaluated directly instead of via scipy to avoid its input processing on every call
+        x = np.asarray(x)
+        logpmf = (
+            gammaln(self.n_trials + 1)
+            - np.sum(gammaln(x + 1), axis=-1)
+            + np.sum(xlogy(x, self.probabilities), axis=-1)
+        )
+        in_support = np.all((x >= 0) & (x == np.floor(x)), axis=-1) & (
+            np.sum(x, axis=-1) == self.n_trials
+        )
+        return np.where(in_support, logpmf, -np.inf)
 
     def pdf(self, x: np.ndarray) -> np.ndarray:
         """Probability mass function.
@@ -90,7 +98,7 @@ class Multinomial(Discrete):
         Returns:
             PMF at positions
         """
-        return self.scipy_multinomial.pmf(x)
+        return np.exp(self.logpdf(x))
 
     def cdf(self, x: np.ndarray) -> None:
         """Cumulative distribution function.
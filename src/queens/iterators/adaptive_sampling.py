@@ -15,7 +15,6 @@
 """Adaptive sampling iterator."""
 
 import logging
-import pickle
 import types
 
 import jax
@@ -25,6 +24,7 @@ from jax import jit
 
 from queens.iterators._iterator import Iterator
 from queens.iterators.sequential_monte_carlo_chopin import SequentialMonteCarloChopin
+from queens.utils import process_outputs
 from queens.utils.io import load_result
 
 _logger = logging.getLogger(__name__)
@@ -47,6 +47,7 @@ class AdaptiveSampling(Iterator):
         x_train_new (np.ndarray): Newly drawn training samples
         y_train (np.ndarray): Training likelihood output samples
         model_outputs (np.ndarray): Training model output samples
+        results (dict): Results of all adaptive steps written to the result file
     """
 
     def __init__(
@@ -95,6 +96,7 @@ class AdaptiveSampling(Iterator):
         self.y_train = np.empty((0, 1))
         self.model_outputs = np.empty((0, self.likelihood_model.y_obs.size))
         self.model_outputs_failed = np.empty((0, self.likelihood_model.y_obs.size))
+        self.results = None
 
     def pre_run(self):
         """Pre run."""
@@ -102,6 +104,7 @@ class AdaptiveSampling(Iterator):
 
         if self.restart_file:
             results = load_result(self.restart_file)
+            self.results = results
             self.x_train = results["x_train"][-1]
             self.model_outputs = results["model_outputs"][-1]
             self.y_train = results["y_train"][-1]
@@ -141,7 +144,7 @@ class AdaptiveSampling(Iterator):
             particles, weights, log_posterior = self.solving_iterator.get_particles_and_weights()
             self.x_train_new = self.choose_new_samples(particles, weights)
 
-            cs_div = self.write_results(particles, weights, log_posterior, i)
+            cs_div = self.write_results(particles, weights, log_posterior)
 
             if cs_div < self.cs_div_criterion:
                 _logger.info(
@@ -246,23 +249,21 @@ class AdaptiveSampling(Iterator):
 
         return x_train_new
 
-    def write_results(self, particles, weights, log_posterior, iteration):
+    def write_results(self, particles, weights, log_posterior):
         """Write results to output file and calculate cs_div.
 
         Args:
             particles (np.ndarray): Particles of approximated posterior
             weights (np.ndarray): Particle weights of approximated posterior
             log_posterior (np.ndarray): Log posterior value of particles
-            iteration (int): Iteration count
 
         Returns:
             cs_div (float): Maximum Cauchy-Schwarz divergence between marginals of the current and
                             previous step
         """
-        result_file = self.global_settings.result_file(".pickle")
-
-        if iteration == 0 and not self.restart_file:
-            results = {
+        # The results are kept in memory to avoid reloading the growing result file in every step
+        if self.results is None:
+            self.results = {
                 "x_train": [],
                 "x_train_failed": [],
                 "model_outputs": [],
@@ -276,9 +277,8 @@ class AdaptiveSampling(Iterator):
             }
             cs_div = np.nan
         else:
-            results = load_result(result_file)
-            particles_prev = results["particles"][-1]
-            weights_prev = results["weights"][-1]
+            particles_prev = self.results["particles"][-1]
+            weights_prev = self.results["weights"][-1]
             samples_prev = particles_prev[
                 np.random.choice(np.arange(weights_prev.size), 5_000, p=weights_prev)
             ]
@@ -286,19 +286,18 @@ class AdaptiveSampling(Iterator):
             cs_div = float(cauchy_schwarz_divergence(samples_prev, samples_curr))
             _logger.info("Cauchy Schwarz divergence: %.2e", cs_div)
 
-        results["x_train"].append(self.x_train)
-        results["x_train_failed"].append(self.x_train_failed)
-        results["model_outputs"].append(self.model_outputs)
-        results["model_outputs_failed"].append(self.model_outputs_failed)
-        results["y_train"].append(self.y_train)
-        results["x_train_new"].append(self.x_train_new)
-        results["particles"].append(particles)
-        results["weights"].append(weights)
-        results["log_posterior"].append(log_posterior)
-        results["cs_div"].append(cs_div)
-
-        with open(result_file, "wb") as handle:
-            pickle.dump(results, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        self.results["x_train"].append(self.x_train)
+        self.results["x_train_failed"].append(self.x_train_failed)
+        self.results["model_outputs"].append(self.model_outputs)
+        self.results["model_outputs_failed"].append(self.model_outputs_failed)
+        self.results["y_train"].append(self.y_train)
+        self.results["x_train_new"].append(self.x_train_new)
+        self.results["particles"].append(particles)
+        self.results["weights"].append(weights)
+        self.results["log_posterior"].append(log_posterior)
+        self.results["cs_div"].append(cs_div)
+
+        process_outputs.write_results(self.results, self.global_settings.result_file(".pickle"))
 
         return cs_div
 
@@ -15,9 +15,10 @@
 """Data iterator."""
 
 import logging
-import pickle
+from pathlib import Path
 
 from queens.iterators._iterator import Iterator
+from queens.utils.io import load_pickle
 from queens.utils.logger_settings import log_init_args
 from queens.utils.process_outputs import process_outputs, write_results
 
@@ -89,7 +90,5 @@ class Data(Iterator):
             np.array, np.array: Two arrays, the first contains input samples,
             the second the corresponding output samples
         """
-        with open(self.path_to_data, "rb") as file:
-            data = pickle.load(file)
-
+        data = load_pickle(Path(self.path_to_data))
         return data
@@ -155,11 +155,7 @@ class Grid(Iterator):
                 )
 
         grid_coords = np.meshgrid(*grid_point_list)
-        self.samples = np.empty(
-            [np.prod(self.num_grid_points_per_axis), self.num_parameters], dtype=object
-        )
-        for i in range(self.num_parameters):
-            self.samples[:, i] = grid_coords[i].flatten()
+        self.samples = np.stack([coords.ravel() for coords in grid_coords], axis=1, dtype=object)
 
     def core_run(self):
         """Evaluate the meshgrid on model."""
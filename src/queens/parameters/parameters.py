@@ -246,12 +246,10 @@ class Parameters:
         Returns:
             sample_dict: Dictionary containing sample members and the corresponding parameter keys
         """
-        sample_dict = {}
         sample = sample.reshape(-1)
         if self.random_field_flag:
             sample = self.expand_random_field_realization(sample)
-        for j, key in enumerate(self.parameters_keys):
-            sample_dict[key] = sample[j]
+        sample_dict = dict(zip(self.parameters_keys, sample, strict=True))
         return sample_dict
 
     def dict_as_sample(self, sample_dict: dict) -> np.ndarray:
@@ -15,13 +15,16 @@
 """QUEENS dask scheduler parent class."""
 
 import abc
+import inspect
 import logging
 import time
 from collections.abc import Iterable
 
 import numpy as np
 import tqdm
+from dask.base import tokenize
 from dask.distributed import as_completed
+from dask.utils import funcname
 
 from queens.schedulers._scheduler import Scheduler, SchedulerCallableSignature
 from queens.utils.printing import get_str_table
@@ -36,6 +39,10 @@ class Dask(Scheduler):
         num_procs (int): Number of processors per job
         client (Client): Dask client that connects to and submits computation to a Dask cluster
         restart_workers (bool): If True, restart workers after each finished job
+        cache_results (bool): If True, identical samples are only evaluated once
+        max_cached_results (int): Maximum number of results kept alive for caching
+        cached_futures (dict): Futures of previous evaluations kept alive for caching, ordered
+            from least to most recently used
     """
 
     def __init__(
@@ -46,6 +53,8 @@ class Dask(Scheduler):
         num_procs,
         restart_workers,
         verbose=True,
+        cache_results=False,
+        max_cached_results=1000,
     ):
         """Initialize scheduler.
 
@@ -56,6 +65,12 @@ class Dask(Scheduler):
             num_procs (int): Number of processors per job
             restart_workers (bool): If True, restart workers after each finished job
             verbose (bool, opt): Verbosity of evaluations. Defaults to True.
+            cache_results (bool, opt): If True, samples are submitted as pure tasks with a
+                content-hashed key such that identical samples are served from the results of
+                previous evaluations. Only useful if samples recur, e.g., for MCMC.
+                Defaults to False.
+            max_cached_results (int, opt): Maximum number of results kept alive for caching.
+                The least recently used results are released first. Defaults to 1000.
         """
         super().__init__(
             experiment_name=experiment_name,
@@ -65,6 +80,9 @@ class Dask(Scheduler):
         )
         self.num_procs = num_procs
         self.restart_workers = restart_workers
+        self.cache_results = cache_results
+        self.max_cached_results = max_cached_results
+        self.cached_futures = {}
 
         self.client = None
         self.start_cluster_and_connect_client()
@@ -110,15 +128,22 @@ class Dask(Scheduler):
 
         if job_ids is None:
             job_ids = self.get_job_ids(len(samples))
-        futures = self.client.map(
-            run_function,
-            samples,
-            job_ids,
-            pure=False,
-            num_procs=self.num_procs,
-            experiment_dir=self.experiment_dir,
-            experiment_name=self.experiment_name,
-        )
+        map_kwargs = {
+            "num_procs": self.num_procs,
+            "experiment_dir": self.experiment_dir,
+            "experiment_name": self.experiment_name,
+        }
+        if self.cache_results:
+            # The function is tokenized by its content, e.g., the configuration of a driver.
+            # Functions that can not be tokenized deterministically get a unique token.
+            function_token = tokenize(function)
+            # The name of callable objects like drivers contains their id, so use the class name
+            name = funcname(function) if inspect.isroutine(function) else type(function).__name__
+            keys = [f"{name}-{tokenize(function_token, sample)}" for sample in samples]
+            futures = self.client.map(run_function, samples, job_ids, key=keys, **map_kwargs)
+            self._update_cached_futures(futures)
+        else:
+            futures = self.client.map(run_function, samples, job_ids, pure=False, **map_kwargs)
 
         # The theoretical number of sequential jobs
         num_sequential_jobs = int(np.ceil(len(samples) / self.num_jobs))
@@ -132,7 +157,7 @@ class Dask(Scheduler):
                     worker = list(self.client.who_has(future).values())[0]
                     self.restart_worker(worker)
 
-            if self.verbose:
+            if self.verbose and _logger.isEnabledFor(logging.INFO):
                 elapsed_time = progressbar.format_dict["elapsed"]
                 averaged_time_per_job = elapsed_time / num_sequential_jobs
 
@@ -149,7 +174,21 @@ class Dask(Scheduler):
                     )
                 )
 
-        return list(results.values())
+        return [results[future.key] for future in futures]
+
+    def _update_cached_futures(self, futures):
+        """Keep the most recently used futures alive for caching.
+
+        Dask only reuses results of keys that are still referenced.
+
+        Args:
+            futures (list): Futures of the current evaluation
+        """
+        for future in futures:
+            self.cached_futures.pop(future.key, None)
+            self.cached_futures[future.key] = future
+        while len(self.cached_futures) > self.max_cached_results:
+            self.cached_futures.pop(next(iter(self.cached_futures)))
 
     @abc.abstractmethod
     def restart_worker(self, worker):
@@ -157,6 +196,7 @@ class Dask(Scheduler):
 
     def shutdown_client(self):
         """Shutdown the DASK client."""
+        self.cached_futures = {}
         if self.client is not None:
             try:
                 self.client.shutdown()
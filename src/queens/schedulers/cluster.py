@@ -21,7 +21,6 @@ from pathlib import Path
 from typing import Sequence
 
 from dask.distributed import Client
-from dask_jobqueue import PBSCluster, SLURMCluster
 
 from queens.schedulers._dask import Dask
 from queens.utils.config_directories import experiment_directory  # Do not change this import!
@@ -31,9 +30,11 @@ from queens.utils.valid_options import get_option
 
 _logger = logging.getLogger(__name__)
 
+# The dask_jobqueue cluster classes are only needed on the remote host, see start_dask_cluster.py.
+# They are referenced by name to avoid importing dask_jobqueue locally.
 VALID_WORKLOAD_MANAGERS = {
     "slurm": {
-        "dask_cluster_cls": SLURMCluster,
+        "dask_cluster_cls_name": "SLURMCluster",
         "job_extra_directives": lambda nodes, cores: f"--ntasks={nodes * cores}",
         "job_directives_skip": [
             "#SBATCH -n 1",
@@ -42,7 +43,7 @@ VALID_WORKLOAD_MANAGERS = {
         ],
     },
     "pbs": {
-        "dask_cluster_cls": PBSCluster,
+        "dask_cluster_cls_name": "PBSCluster",
         "job_extra_directives": lambda nodes, cores: f"-l nodes={nodes}:ppn={cores}",
         "job_directives_skip": ["#PBS -l select"],
     },
@@ -90,6 +91,8 @@ class Cluster(Dask):
         experiment_base_dir=None,
         overwrite_existing_experiment=False,
         job_script_prologue=None,
+        cache_results=False,
+        max_cached_results=1000,
     ):
         """Init method for the cluster scheduler.
 
@@ -115,6 +118,8 @@ class Cluster(Dask):
                 exists already. If False, prompt user for confirmation before overwriting.
             job_script_prologue (list, opt): List of commands to be executed before starting a
                 worker.
+            cache_results (bool, opt): If True, identical samples are only evaluated once.
+            max_cached_results (int, opt): Maximum number of results kept alive for caching.
         """
         self.remote_connection = remote_connection
         self.remote_connection.open()
@@ -150,6 +155,8 @@ class Cluster(Dask):
             num_procs=num_procs,
             restart_workers=restart_workers,
             verbose=verbose,
+            cache_results=cache_results,
+            max_cached_results=max_cached_results,
         )
 
     def remote_experiment_dir(
@@ -37,6 +37,8 @@ class Local(Dask):
         verbose=True,
         experiment_base_dir=None,
         overwrite_existing_experiment=False,
+        cache_results=False,
+        max_cached_results=1000,
     ):
         """Initialize local scheduler.
 
@@ -50,6 +52,8 @@ class Local(Dask):
             experiment_base_dir (str, Path): Base directory for the simulation outputs
             overwrite_existing_experiment (bool): If True, overwrite experiment directory if it
                 exists already. If False, prompt user for confirmation before overwriting.
+            cache_results (bool, opt): If True, identical samples are only evaluated once.
+            max_cached_results (int, opt): Maximum number of results kept alive for caching.
         """
         # pylint: disable=duplicate-code
         experiment_dir = self.local_experiment_dir(
@@ -62,6 +66,8 @@ class Local(Dask):
             num_procs=num_procs,
             restart_workers=restart_workers,
             verbose=verbose,
+            cache_results=cache_results,
+            max_cached_results=max_cached_results,
         )
 
     def _start_cluster_and_connect_client(self):
@@ -19,7 +19,7 @@ import logging
 
 import numpy as np
 
-from queens.utils.iterative_averaging import l1_norm, l2_norm, relative_change
+from queens.utils.iterative_averaging import l2_norm
 from queens.utils.printing import get_str_table
 from queens.utils.valid_options import get_option
 
@@ -178,11 +178,17 @@ class StochasticOptimizer(metaclass=abc.ABCMeta):
             old_parameters (np.array): Old parameters
             new_parameters (np.array): New parameters
         """
-        self.rel_l2_change = relative_change(
-            old_parameters, new_parameters, lambda x: l2_norm(x, averaged=True)
+        # Averaged norms as in relative_change, with the increment computed only once
+        increment = np.nan_to_num(old_parameters - new_parameters).ravel()
+        old_parameters = np.nan_to_num(old_parameters).ravel()
+        num_parameters = increment.size
+        self.rel_l2_change = np.sqrt(np.dot(increment, increment) / num_parameters) / (
+            np.sqrt(np.dot(old_parameters, old_parameters) / num_parameters) + 1e-16
         )
-        self.rel_l1_change = relative_change(
-            old_parameters, new_parameters, lambda x: l1_norm(x, averaged=True)
+        self.rel_l1_change = (
+            np.sum(np.abs(increment))
+            / num_parameters
+            / (np.sum(np.abs(old_parameters)) / num_parameters + 1e-16)
         )
 
     def do_single_iteration(self, gradient):
@@ -205,14 +211,26 @@ class StochasticOptimizer(metaclass=abc.ABCMeta):
     def clip_gradient(self, gradient):
         """Clip the gradient by value and then by norm.
 
+        All steps work in place on a single copy of the gradient. Clipping steps with an infinite
+        threshold (the default) are skipped, non-finite gradient components are set to zero in any
+        case.
+
         Args:
             gradient (np.array): Current gradient
 
         Returns:
             gradient (np.array): The clipped gradient
         """
-        gradient = clip_by_value(gradient, self.clip_by_value_threshold)
-        gradient = clip_by_l2_norm(gradient, self.clip_by_l2_norm_threshold)
+        gradient = np.nan_to_num(gradient)
+        if self.clip_by_value_threshold < np.inf:
+            np.clip(
+                gradient, -self.clip_by_value_threshold, self.clip_by_value_threshold, out=gradient
+            )
+        if self.clip_by_l2_norm_threshold < np.inf:
+            gradient_l2_norm = l2_norm(gradient)
+            if gradient_l2_norm > self.clip_by_l2_norm_threshold:
+                gradient /= gradient_l2_norm / self.clip_by_l2_norm_threshold
+                _logger.warning("Gradient clipped due to large norm!")
         return gradient
 
     def __next__(self):
@@ -233,7 +251,8 @@ class StochasticOptimizer(metaclass=abc.ABCMeta):
         """
         if self.done:
             raise StopIteration
-        old_parameters = self.current_variational_parameters.copy()
+        # No copy needed, the update in do_single_iteration creates a new parameter array
+        old_parameters = self.current_variational_parameters
         current_gradient = self.gradient(self.current_variational_parameters)
         if self.learning_rate_decay:
             self.learning_rate = self.learning_rate_decay(
@@ -314,36 +333,3 @@ class StochasticOptimizer(metaclass=abc.ABCMeta):
         """
         print_dict = self._get_print_dict()
         return get_str_table(self._name, print_dict)
-
-
-def clip_by_l2_norm(gradient, l2_norm_threshold=1e6):
-    """Clip gradients by L2-norm.
-
-    Args:
-        gradient (np.array): Gradient
-        l2_norm_threshold (float): Clipping threshold
-    Returns:
-        gradient (np.array): Clipped gradients
-    """
-    gradient = np.nan_to_num(gradient)
-    gradient_l2_norm = l2_norm(gradient)
-    if gradient_l2_norm > l2_norm_threshold:
-        gradient /= gradient_l2_norm / l2_norm_threshold
-        _logger.warning("Gradient clipped due to large norm!")
-    return gradient
-
-
-def clip_by_value(gradient, threshold=1e6):
-    """Clip gradients by value.
-
-    Clips if the absolute value op the component is larger than the threshold.
-
-    Args:
-        gradient (np.array): Gradient
-        threshold (float): Threshold to clip
-    Returns:
-        gradient (np.array): Clipped gradients
-    """
-    gradient = np.nan_to_num(gradient)
-    gradient = np.clip(gradient, -threshold, threshold)
-    return gradient
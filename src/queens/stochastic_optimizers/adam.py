@@ -19,7 +19,6 @@ import logging
 import numpy as np
 
 from queens.stochastic_optimizers._stochastic_optimizer import StochasticOptimizer
-from queens.utils.iterative_averaging import ExponentialAveraging
 
 _logger = logging.getLogger(__name__)
 
@@ -33,8 +32,10 @@ class Adam(StochasticOptimizer):
     Attributes:
         beta_1 (float):  :math:`\beta_1` parameter as described in [1].
         beta_2 (float):  :math:`\beta_2` parameter as described in [1].
-        m (ExponentialAveragingObject): Exponential average of the gradient.
-        v (ExponentialAveragingObject): Exponential average of the gradient momentum.
+        m (np.array): Exponential average of the gradient.
+        v (np.array): Exponential average of the gradient momentum.
+        beta_1_power (float): :math:`\beta_1` to the power of the current iteration.
+        beta_2_power (float): :math:`\beta_2` to the power of the current iteration.
         eps (float): Nugget term to avoid a division by values close to zero.
     """
 
@@ -84,8 +85,10 @@ class Adam(StochasticOptimizer):
         )
         self.beta_1 = beta_1
         self.beta_2 = beta_2
-        self.m = ExponentialAveraging(coefficient=beta_1)
-        self.v = ExponentialAveraging(coefficient=beta_2)
+        self.m = None
+        self.v = None
+        self.beta_1_power = 1.0
+        self.beta_2_power = 1.0
         self.eps = eps
 
     def scheme_specific_gradient(self, gradient):
@@ -98,12 +101,23 @@ class Adam(StochasticOptimizer):
             gradient (np.array): Adam gradient
         """
         if self.iteration == 0:
-            self.m.current_average = np.zeros(gradient.shape)
-            self.v.current_average = np.zeros(gradient.shape)
+            # Store the moments in the floating point precision of the gradient
+            dtype = np.result_type(gradient, 1.0)
+            self.m = np.zeros(gradient.shape, dtype=dtype)
+            self.v = np.zeros(gradient.shape, dtype=dtype)
+            self.beta_1_power = 1.0
+            self.beta_2_power = 1.0
 
-        m_hat = self.m.update_average(gradient)
-        v_hat = self.v.update_average(gradient**2)
-        m_hat /= 1 - self.beta_1 ** (self.iteration + 1)
-        v_hat /= 1 - self.beta_2 ** (self.iteration + 1)
-        gradient = m_hat / (v_hat**0.5 + self.eps)
-        return gradient
+        # Update the exponential averages in place
+        self.m *= self.beta_1
+        self.m += (1 - self.beta_1) * gradient
+        self.v *= self.beta_2
+        self.v += (1 - self.beta_2) * gradient**2
+        self.beta_1_power *= self.beta_1
+        self.beta_2_power *= self.beta_2
+        m_hat = self.m / (1 - self.beta_1_power)
+        v_hat = self.v / (1 - self.beta_2_power)
+        np.sqrt(v_hat, out=v_hat)
+        v_hat += self.eps
+        m_hat /= v_hat
+        return m_hat
@@ -19,7 +19,6 @@ import logging
 import numpy as np
 
 from queens.stochastic_optimizers._stochastic_optimizer import StochasticOptimizer
-from queens.utils.iterative_averaging import ExponentialAveraging
 
 _logger = logging.getLogger(__name__)
 
@@ -33,8 +32,9 @@ class Adamax(StochasticOptimizer):
     Attributes:
         beta_1 (float): :math:`\beta_1` parameter as described in [1].
         beta_2 (float): :math:`\beta_2` parameter as described in [1].
-        m (ExponentialAveragingObject): Exponential average of the gradient.
+        m (np.array): Exponential average of the gradient.
         u (np.array): Maximum gradient momentum.
+        beta_1_power (float): :math:`\beta_1` to the power of the current iteration.
         eps (float): Nugget term to avoid a division by values close to zero.
     """
 
@@ -84,8 +84,9 @@ class Adamax(StochasticOptimizer):
         )
         self.beta_1 = beta_1
         self.beta_2 = beta_2
-        self.m = ExponentialAveraging(coefficient=beta_1)
+        self.m = None
         self.u = 0
+        self.beta_1_power = 1.0
         self.eps = eps
 
     def scheme_specific_gradient(self, gradient):
@@ -98,12 +99,18 @@ class Adamax(StochasticOptimizer):
             gradient (np.array): Adam gradient
         """
         if self.iteration == 0:
-            self.m.current_average = np.zeros(gradient.shape)
-            self.u = np.zeros(gradient.shape)
+            # Store the moments in the floating point precision of the gradient
+            dtype = np.result_type(gradient, 1.0)
+            self.m = np.zeros(gradient.shape, dtype=dtype)
+            self.u = np.zeros(gradient.shape, dtype=dtype)
+            self.beta_1_power = 1.0
 
-        m_hat = self.m.update_average(gradient)
-        m_hat /= 1 - self.beta_1 ** (self.iteration + 1)
-        abs_grad = np.abs(gradient)
-        self.u = np.maximum(self.beta_2 * self.u, abs_grad)
-        gradient = m_hat / (self.u + self.eps)
-        return gradient
+        # Update the exponential average in place
+        self.m *= self.beta_1
+        self.m += (1 - self.beta_1) * gradient
+        self.beta_1_power *= self.beta_1
+        m_hat = self.m / (1 - self.beta_1_power)
+        self.u *= self.beta_2
+        np.maximum(self.u, np.abs(gradient), out=self.u)
+        m_hat /= self.u + self.eps
+        return m_hat
@@ -19,7 +19,6 @@ import logging
 import numpy as np
 
 from queens.stochastic_optimizers._stochastic_optimizer import StochasticOptimizer
-from queens.utils.iterative_averaging import ExponentialAveraging
 
 _logger = logging.getLogger(__name__)
 
@@ -33,7 +32,8 @@ class RMSprop(StochasticOptimizer):
 
     Attributes:
         beta (float):  :math:`\beta` parameter as described in [1].
-        v (ExponentialAveragingObject): Exponential average of the gradient momentum.
+        v (np.array): Exponential average of the gradient momentum.
+        beta_power (float): :math:`\beta` to the power of the current iteration.
         eps (float): Nugget term to avoid a division by values close to zero.
     """
 
@@ -80,7 +80,8 @@ class RMSprop(StochasticOptimizer):
             learning_rate_decay=learning_rate_decay,
         )
         self.beta = beta
-        self.v = ExponentialAveraging(coefficient=beta)
+        self.v = None
+        self.beta_power = 1.0
         self.eps = eps
 
     def scheme_specific_gradient(self, gradient):
@@ -93,9 +94,16 @@ class RMSprop(StochasticOptimizer):
             gradient (np.array): RMSprop gradient
         """
         if self.iteration == 0:
-            self.v.current_average = np.zeros(gradient.shape)
+            # Store the average in the floating point precision of the gradient
+            self.v = np.zeros(gradient.shape, dtype=np.result_type(gradient, 1.0))
+            self.beta_power = 1.0
 
-        v_hat = self.v.update_average(gradient**2)
-        v_hat /= 1 - self.beta ** (self.iteration + 1)
-        gradient = gradient / (v_hat**0.5 + self.eps)
+        # Update the exponential average in place
+        self.v *= self.beta
+        self.v += (1 - self.beta) * gradient**2
+        self.beta_power *= self.beta
+        v_hat = self.v / (1 - self.beta_power)
+        np.sqrt(v_hat, out=v_hat)
+        v_hat += self.eps
+        gradient = gradient / v_hat
         return gradient
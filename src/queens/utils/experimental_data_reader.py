@@ -49,7 +49,9 @@ class ExperimentalDataReader:
         """Initialize ExperimentalDataReader.
 
         Args:
-            data_processor: data processor for experimental data
+            data_processor: data processor for experimental data. Defaults to a csv data processor
+                reading the entire file. Binary data, e.g., labeled arrays in a npz file, can be
+                read by passing a numpy data processor.
             output_label: Label that marks the output quantity in the csv file
             coordinate_labels: List of column-wise coordinate labels in csv files
             time_label: Name of the time variable in csv file
@@ -63,7 +65,7 @@ class ExperimentalDataReader:
         self.base_dir = Path(csv_data_base_dir)
 
         if data_processor is None:
-            self.data_processor = CsvFile(
+            data_processor = CsvFile(
                 file_name_identifier=self.file_name,
                 file_options_dict={
                     "header_row": 0,
@@ -72,6 +74,7 @@ class ExperimentalDataReader:
                     "filter": {"type": "entire_file"},
                 },
             )
+        self.data_processor = data_processor
 
     def get_experimental_data(self) -> tuple[
         np.ndarray,
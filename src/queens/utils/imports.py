@@ -104,6 +104,9 @@ def import_class_from_class_module_map(
 ) -> Any:
     """Import class from class_module_map.
 
+    The class is also set as attribute of the package, such that later accesses do not go
+    through the module-level *__getattr__* of the package again.
+
     Args:
         name: Name of the class.
         class_module_map: Class to module mapping.
@@ -114,7 +117,10 @@ def import_class_from_class_module_map(
     """
     if name in class_module_map:
         module = importlib.import_module(class_module_map[name], package=package)
-        return getattr(module, name)
+        class_object = getattr(module, name)
+        if package in sys.modules:
+            setattr(sys.modules[package], name, class_object)
+        return class_object
     raise AttributeError
 
 
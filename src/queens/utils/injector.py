@@ -18,9 +18,10 @@ The module supplies functions to inject parameter values into a template
 text file.
 """
 
+from functools import lru_cache
 from pathlib import Path
 
-from jinja2 import Environment, StrictUndefined, Undefined
+from jinja2 import Environment, StrictUndefined, Template, Undefined
 
 from queens.utils.io import read_file
 
@@ -36,10 +37,25 @@ def render_template(params: dict, template: str, strict: bool = True) -> str:
     Returns:
         injected template
     """
+    return _compile_template(template, strict).render(**params)
+
+
+@lru_cache(maxsize=32)
+def _compile_template(template: str, strict: bool) -> Template:
+    """Compile a template.
+
+    Drivers render the same templates for every job, so the compiled templates are cached.
+
+    Args:
+        template: Template file as string
+        strict: Raises exception if required parameters from the template are missing
+
+    Returns:
+        compiled template
+    """
     undefined = StrictUndefined if strict else Undefined
 
-    environment = Environment(undefined=undefined).from_string(template)
-    return environment.render(**params)
+    return Environment(undefined=undefined).from_string(template)
 
 
 def inject_in_template(
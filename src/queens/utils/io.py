@@ -26,6 +26,12 @@ import yaml
 
 from queens.utils.exceptions import FileTypeError
 
+# Use the libyaml-based loader if PyYAML was built against it
+try:
+    from yaml.cyaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml.loader import SafeLoader
+
 _logger = logging.getLogger(__name__)
 
 
@@ -114,7 +120,7 @@ def load_input_file(input_file_path: Path) -> dict:
     if file_type == ".json":
         loader = json.load
     elif file_type in [".yml", ".yaml"]:
-        loader = yaml.safe_load
+        loader = _load_yaml
     else:
         raise FileTypeError(
             f"Only json or yaml/yml files allowed, not of type '{file_type}' ({input_file_path})"
@@ -129,6 +135,18 @@ def load_input_file(input_file_path: Path) -> dict:
     return options
 
 
+def _load_yaml(stream: Any) -> Any:
+    """Load a yaml stream with the libyaml-based safe loader if available.
+
+    Args:
+        stream: Opened yaml input file
+
+    Returns:
+        Options in the input file.
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
 def load_result(path_to_result_file: Path) -> Any:
     """Load QUEENS results.
 
@@ -291,9 +291,10 @@ def l2_norm(vector: NumericalValue, averaged: bool = False) -> float | np.floati
     Returns:
         L2 norm of the vector
     """
-    vector = np.array(vector).flatten()
-    vector = np.nan_to_num(vector)
-    norm = np.sum(vector**2) ** 0.5
+    vector = np.ravel(vector)
+    if not np.isfinite(vector).all():
+        vector = np.nan_to_num(vector)
+    norm = np.linalg.norm(vector)
     if averaged:
         norm /= len(vector) ** 0.5
     return norm
@@ -256,26 +256,28 @@ def log_init_args(method: Callable[P, None]) -> Callable[P, None]:
 
     @functools.wraps(method)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> None:
-        signature = inspect.signature(method)
-        default_kwargs = {
-            k: v.default
-            for k, v in signature.parameters.items()
-            if v.default is not inspect.Parameter.empty
-        }
-
-        all_keys = list(signature.parameters.keys())
-        args_as_kwargs = {all_keys[i]: args[i] for i in range(len(args))}
-        all_kwargs = dict(default_kwargs, **args_as_kwargs, **kwargs)
-
-        def key_fun(pair: tuple[str, Any]) -> int:
-            if pair[0] in all_keys:
-                return all_keys.index(pair[0])
-            return len(all_keys)
-
-        all_kwargs = dict(sorted(all_kwargs.items(), key=key_fun))
-
         _logger = logging.getLogger(args[0].__module__)
-        _logger.info(get_str_table(args[0].__class__.__name__, all_kwargs, use_repr=True))
+        # Skip formatting the arguments table if it would not be logged anyway
+        if _logger.isEnabledFor(logging.INFO):
+            signature = inspect.signature(method)
+            default_kwargs = {
+                k: v.default
+                for k, v in signature.parameters.items()
+                if v.default is not inspect.Parameter.empty
+            }
+
+            all_keys = list(signature.parameters.keys())
+            args_as_kwargs = {all_keys[i]: args[i] for i in range(len(args))}
+            all_kwargs = dict(default_kwargs, **args_as_kwargs, **kwargs)
+
+            def key_fun(pair: tuple[str, Any]) -> int:
+                if pair[0] in all_keys:
+                    return all_keys.index(pair[0])
+                return len(all_keys)
+
+            all_kwargs = dict(sorted(all_kwargs.items(), key=key_fun))
+
+            _logger.info(get_str_table(args[0].__class__.__name__, all_kwargs, use_repr=True))
         method(*args, **kwargs)
 
     return wrapper
@@ -399,9 +399,9 @@ def get_port() -> int:
     Returns:
         Free port
     """
-    sock = socket.socket()
-    sock.bind(("", 0))
-    return int(sock.getsockname()[1])
+    with socket.socket() as sock:
+        sock.bind(("", 0))
+        return int(sock.getsockname()[1])
 
 
 VALID_CONNECTION_TYPES = {"remote_connection": RemoteConnection}
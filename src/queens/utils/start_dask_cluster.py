@@ -22,6 +22,8 @@ import sys
 from pathlib import Path
 from typing import Sequence
 
+import dask_jobqueue
+
 from queens.schedulers.cluster import VALID_WORKLOAD_MANAGERS
 from queens.utils.logger_settings import setup_basic_logging
 from queens.utils.valid_options import get_option
@@ -75,7 +77,7 @@ if __name__ == "__main__":
         sys.exit(1)
 
     dask_cluster_options = get_option(VALID_WORKLOAD_MANAGERS, args.workload_manager)
-    dask_cluster_cls = dask_cluster_options["dask_cluster_cls"]
+    dask_cluster_cls = getattr(dask_jobqueue, dask_cluster_options["dask_cluster_cls_name"])
 
     _logger.info("Starting event loop")
     loop = asyncio.new_event_loop()
@@ -92,7 +92,7 @@ class BMFIAVisualization:
             if self.save_bools[0] is not None:
                 _save_plot(self.save_bools[0], self.paths[0])
 
-    def plot_posterior_from_samples(self, samples, weights, dim_labels_lst):
+    def plot_posterior_from_samples(self, samples, weights, dim_labels_lst, max_num_samples=5_000):
         """Visualize the posterior distribution or marginals for posteriors.
 
         Visualize the multi-fidelity posterior distribution (up to 2D) or
@@ -105,6 +105,8 @@ class BMFIAVisualization:
             weights (np.array): Weights of the posterior samples. One weight for each sample row.
             dim_labels_lst (lst): List with labels/naming of the involved dimensions.
                                 Order of the list corresponds to order of columns in sample matrix.
+            max_num_samples (int, opt): Maximum number of samples to plot. Larger sample sets are
+                                        resampled according to their weights.
         """
         if self.plot_booleans[1]:
             if samples.shape[1] > 2:
@@ -113,10 +115,28 @@ class BMFIAVisualization:
                     f"Your posterior has {samples.shape[1]}-dimensions. Abort ...."
                 )
 
-            sns.set_theme(style="whitegrid")
-            _, ax = plt.subplots(figsize=(6, 6))
-            sns.scatterplot(x=samples[:, 0], y=samples[:, 1], s=5)
-            sns.kdeplot(x=samples[:, 0], y=samples[:, 1], weights=weights)
+            if samples.shape[0] > max_num_samples:
+                # Use a separate generator to leave the global random state untouched
+                indices = np.random.default_rng(seed=0).choice(
+                    samples.shape[0], size=max_num_samples, p=weights / np.sum(weights)
+                )
+                samples = samples[indices]
+                # Unweighted hexbins are counted with numpy instead of a Python loop over samples
+                weights = None
+
+            # Scope the style to this figure instead of changing the global theme
+            with sns.axes_style("whitegrid"):
+                fig, ax = plt.subplots(figsize=(6, 6))
+            # The weighted histogram shows the posterior density in a single pass over the samples
+            hexbin = ax.hexbin(
+                samples[:, 0],
+                samples[:, 1],
+                C=weights,
+                reduce_C_function=np.sum,
+                gridsize=80,
+                cmap="Greys",
+            )
+            fig.colorbar(hexbin, ax=ax)
 
             ax.set_title(r"Posterior distribution $p(x,y|D)$")
             ax.set_xlabel(rf"${dim_labels_lst[0]}$")
@@ -124,11 +144,12 @@ class BMFIAVisualization:
             ax.set_xlim(-0.2, 1.2)
             ax.set_ylim(-0.2, 1.2)
 
-            plt.show()
-
             if self.save_bools[1] is not None:
                 _save_plot(self.save_bools[1], self.paths[1])
 
+            plt.show()
+            plt.close(fig)
+
 
 def plot_model_dependency(z_train, Y_HF_train, regression_obj_lst):
     r"""Plot multi-fidelity dependencies with optional informative features.
@@ -15,6 +15,7 @@
 """Configuration module for the entire test suite (highest level)."""
 
 import getpass
+import importlib
 import logging
 import socket
 from time import perf_counter
@@ -162,6 +163,18 @@ def fixture_time_tests(request):
         yield
 
 
+@pytest.fixture(name="warm_up_imports", autouse=True, scope="session")
+def fixture_warm_up_imports(request):
+    """Import heavy third-party modules once per session if tests are timed.
+
+    Otherwise, their import time is attributed to the first timed test
+    using them.
+    """
+    if request.config.getoption("--test-timing"):
+        for module_name in ["scipy.stats", "pandas", "matplotlib.pyplot", "dask.distributed"]:
+            importlib.import_module(module_name)
+
+
 @pytest.fixture(name="hostname", scope="session")
 def fixture_hostname(name_of_host=NAME_OF_HOST):
     """Hostname calling the test suite."""
@@ -290,7 +303,7 @@ def fixture_global_settings(test_name, tmp_path):
         yield global_settings
 
 
-@pytest.fixture(name="disable_matplot_show", autouse=True)
+@pytest.fixture(name="disable_matplot_show", autouse=True, scope="session")
 def fixture_disable_matplotlib_show():
     """Do not show plots in matplotlib gui during testing.
 
@@ -17,7 +17,7 @@
 import pytest
 
 
-@pytest.fixture(name="setup_symbolic_links_fourc", autouse=True)
+@pytest.fixture(name="setup_symbolic_links_fourc", autouse=True, scope="session")
 def fixture_setup_symbolic_links_fourc(fourc_link):
     """Set-up of 4C symbolic links.
 
@@ -26,8 +26,9 @@ def fixture_setup_symbolic_links_fourc(fourc_link):
     """
     # check if symbolic links are existent
     try:
-        # check if existing link to fourc works and points to a valid file
-        if not fourc_link.resolve().exists():
+        # check if existing link to fourc works and points to a valid file (exists() follows
+        # the link, the link is only resolved for the error message)
+        if not fourc_link.exists():
             raise FileNotFoundError(
                 f"The following link seems to be dead: {fourc_link}\n"
                 f"It points to (non-existing): {fourc_link.resolve()}\n"
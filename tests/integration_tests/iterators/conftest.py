@@ -62,12 +62,8 @@ def fixture_create_experimental_data_gaussian_1d(tmp_path):
     # generate 10 samples from the same gaussian
     samples = STANDARD_NORMAL.draw(10).flatten()
 
-    # evaluate the gaussian pdf for these 1000 samples
-    pdf = []
-    for sample in samples:
-        pdf.append(gaussian_1d_logpdf(sample))
-
-    pdf = np.array(pdf).flatten()
+    # evaluate the gaussian pdf for these 10 samples
+    pdf = gaussian_1d_logpdf(samples)
 
     # write the data to a csv file in tmp_path
     data_dict = {"y_obs": pdf}
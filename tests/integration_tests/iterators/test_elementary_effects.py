@@ -75,21 +75,18 @@ def test_elementary_effects_ishigami90(global_settings):
     results = load_result(global_settings.result_file(".pickle"))
     _logger.info(results)
 
-    assert results["sensitivity_indices"]["mu"][0] == pytest.approx(15.46038594, abs=1e-7)
-    assert results["sensitivity_indices"]["mu"][1] == pytest.approx(0.0, abs=1e-7)
-    assert results["sensitivity_indices"]["mu"][2] == pytest.approx(0.0, abs=1e-7)
-
-    assert results["sensitivity_indices"]["mu_star"][0] == pytest.approx(15.460385940, abs=1e-7)
-    assert results["sensitivity_indices"]["mu_star"][1] == pytest.approx(1.47392000, abs=1e-7)
-    assert results["sensitivity_indices"]["mu_star"][2] == pytest.approx(5.63434321, abs=1e-7)
-
-    assert results["sensitivity_indices"]["sigma"][0] == pytest.approx(15.85512257, abs=1e-7)
-    assert results["sensitivity_indices"]["sigma"][1] == pytest.approx(1.70193622, abs=1e-7)
-    assert results["sensitivity_indices"]["sigma"][2] == pytest.approx(9.20084394, abs=1e-7)
-
-    assert results["sensitivity_indices"]["mu_star_conf"][0] == pytest.approx(13.53414548, abs=1e-7)
-    assert results["sensitivity_indices"]["mu_star_conf"][1] == pytest.approx(0.0, abs=1e-7)
-    assert results["sensitivity_indices"]["mu_star_conf"][2] == pytest.approx(5.51108773, abs=1e-7)
+    expected_sensitivity_indices = np.array(
+        [
+            [15.46038594, 0.0, 0.0],
+            [15.460385940, 1.47392000, 5.63434321],
+            [15.85512257, 1.70193622, 9.20084394],
+            [13.53414548, 0.0, 5.51108773],
+        ]
+    )
+    sensitivity_indices = np.stack(
+        [results["sensitivity_indices"][key] for key in ["mu", "mu_star", "sigma", "mu_star_conf"]]
+    )
+    np.testing.assert_allclose(sensitivity_indices, expected_sensitivity_indices, rtol=0, atol=1e-7)
 
 
 def test_elementary_effects_sobol(
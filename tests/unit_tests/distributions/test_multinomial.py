@@ -124,6 +124,12 @@ def test_logpdf(distribution):
     np.testing.assert_allclose(reference_logpdf, distribution.logpdf(locations))
 
 
+def test_logpdf_outside_support(distribution):
+    """Test logpdf for positions outside of the support."""
+    locations = np.array([[1, 2, 3, 3], [11, -1, 0, 0], [1.5, 2, 3, 3.5]])
+    np.testing.assert_equal(distribution.logpdf(locations), -np.inf)
+
+
 def test_cdf(distribution):
     """Test if cdf raises value error."""
     with pytest.raises(ValueError, match="Method does not support multivariate distributions!"):
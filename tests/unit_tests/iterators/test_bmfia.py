@@ -37,6 +37,15 @@ def fixture_default_bmfia_iterator(
     return iterator
 
 
+@pytest.fixture(name="feature_matrices")
+def fixture_feature_matrices():
+    """Dummy low-fidelity output, input and coordinate matrices for the feature tests."""
+    y_lf_mat = np.array([[1, 2, 3], [1, 2, 3], [1, 2, 3]])
+    x_mat = np.array([[4, 5, 6], [4, 5, 6], [4, 5, 6]])
+    coords_mat = np.array([[7, 8, 9], [10, 11, 12], [13, 14, 15]])
+    return y_lf_mat, x_mat, coords_mat
+
+
 @pytest.fixture(name="approximation_name")
 def fixture_approximation_name():
     """Dummy approximation name for testing."""
@@ -270,11 +279,9 @@ def test_set_feature_strategy(default_bmfia_iterator, mocker):
     mo_time.assert_called_once()
 
 
-def test_get_man_features(default_bmfia_iterator):
+def test_get_man_features(default_bmfia_iterator, feature_matrices):
     """Test generation of manual features."""
-    y_lf_mat = np.array([[1, 2, 3], [1, 2, 3], [1, 2, 3]])
-    x_mat = np.array([[4, 5, 6], [4, 5, 6], [4, 5, 6]])
-    coords_mat = np.array([[7, 8, 9], [10, 11, 12], [13, 14, 15]])
+    y_lf_mat, x_mat, coords_mat = feature_matrices
 
     # test man_features without specifying 'X_cols' --> KeyError
     default_bmfia_iterator.features_config = "man_features"
@@ -282,18 +289,12 @@ def test_get_man_features(default_bmfia_iterator):
         z_mat = default_bmfia_iterator.set_feature_strategy(y_lf_mat, x_mat, coords_mat)
 
     # test man_features with X_col not in list format
-    y_lf_mat = np.array([[1, 2, 3], [1, 2, 3], [1, 2, 3]])
-    x_mat = np.array([[4, 5, 6], [4, 5, 6], [4, 5, 6]])
-    coords_mat = np.array([[7, 8, 9], [10, 11, 12], [13, 14, 15]])
     default_bmfia_iterator.features_config = "man_features"
     default_bmfia_iterator.x_cols = 0
     with pytest.raises(AssertionError):
         z_mat = default_bmfia_iterator.set_feature_strategy(y_lf_mat, x_mat, coords_mat)
 
     # test man_features with X_col as empty list
-    y_lf_mat = np.array([[1, 2, 3], [1, 2, 3], [1, 2, 3]])
-    x_mat = np.array([[4, 5, 6], [4, 5, 6], [4, 5, 6]])
-    coords_mat = np.array([[7, 8, 9], [10, 11, 12], [13, 14, 15]])
     default_bmfia_iterator.features_config = "man_features"
     default_bmfia_iterator.x_cols = []
     with pytest.raises(AssertionError):
@@ -303,9 +304,6 @@ def test_get_man_features(default_bmfia_iterator):
     expected_z_mat = np.array(
         [[[1, 2, 3], [1, 2, 3], [1, 2, 3]], [[4, 4, 4], [4, 4, 4], [4, 4, 4]]]
     )
-    y_lf_mat = np.array([[1, 2, 3], [1, 2, 3], [1, 2, 3]])
-    x_mat = np.array([[4, 5, 6], [4, 5, 6], [4, 5, 6]])
-    coords_mat = np.array([[7, 8, 9], [10, 11, 12], [13, 14, 15]])
 
     # test man features with correct settings
     default_bmfia_iterator.features_config = "man_features"
@@ -314,11 +312,9 @@ def test_get_man_features(default_bmfia_iterator):
     np.testing.assert_array_almost_equal(z_mat, expected_z_mat, decimal=4)
 
 
-def test_get_opt_features(default_bmfia_iterator):
+def test_get_opt_features(default_bmfia_iterator, feature_matrices):
     """Test generation of optimal features."""
-    y_lf_mat = np.array([[1, 2, 3], [1, 2, 3], [1, 2, 3]])
-    x_mat = np.array([[4, 5, 6], [4, 5, 6], [4, 5, 6]])
-    coords_mat = np.array([[7, 8, 9], [10, 11, 12], [13, 14, 15]])
+    y_lf_mat, x_mat, coords_mat = feature_matrices
 
     # test opt_features with num features < 1 --> error
     default_bmfia_iterator.features_config = "opt_features"
@@ -333,11 +329,9 @@ def test_get_opt_features(default_bmfia_iterator):
         default_bmfia_iterator.set_feature_strategy(y_lf_mat, x_mat, coords_mat)
 
 
-def test_get_coord_features(default_bmfia_iterator):
+def test_get_coord_features(default_bmfia_iterator, feature_matrices):
     """Test generation of coordinate features."""
-    y_lf_mat = np.array([[1, 2, 3], [1, 2, 3], [1, 2, 3]])
-    x_mat = np.array([[4, 5, 6], [4, 5, 6], [4, 5, 6]])
-    coords_mat = np.array([[7, 8, 9], [10, 11, 12], [13, 14, 15]])
+    y_lf_mat, x_mat, coords_mat = feature_matrices
 
     # test coord_features without specifying 'coord_cols' --> KeyError
     default_bmfia_iterator.features_config = "coord_features"
@@ -366,11 +360,9 @@ def test_get_coord_features(default_bmfia_iterator):
     np.testing.assert_array_almost_equal(z_mat, expected_z_mat, decimal=4)
 
 
-def test_get_no_features(default_bmfia_iterator):
+def test_get_no_features(default_bmfia_iterator, feature_matrices):
     """Test output without additional features."""
-    y_lf_mat = np.array([[1, 2, 3], [1, 2, 3], [1, 2, 3]])
-    x_mat = np.array([[4, 5, 6], [4, 5, 6], [4, 5, 6]])
-    coords_mat = np.array([[7, 8, 9], [10, 11, 12], [13, 14, 15]])
+    y_lf_mat, x_mat, coords_mat = feature_matrices
 
     expected_z_mat = y_lf_mat[None, :, :]
     default_bmfia_iterator.features_config = "no_features"
@@ -378,11 +370,9 @@ def test_get_no_features(default_bmfia_iterator):
     np.testing.assert_array_almost_equal(z_mat, expected_z_mat, decimal=4)
 
 
-def test_get_time_features(default_bmfia_iterator):
+def test_get_time_features(default_bmfia_iterator, feature_matrices):
     """Test generation of time-based features."""
-    y_lf_mat = np.array([[1, 2, 3], [1, 2, 3], [1, 2, 3]])
-    x_mat = np.array([[4, 5, 6], [4, 5, 6], [4, 5, 6]])
-    coords_mat = np.array([[7, 8, 9], [10, 11, 12], [13, 14, 15]])
+    y_lf_mat, x_mat, coords_mat = feature_matrices
 
     expected_z_mat = np.array([[1, 2, 3, 0], [1, 2, 3, 5], [1, 2, 3, 10]])
     default_bmfia_iterator.features_config = "time_features"
@@ -140,6 +140,12 @@ def test_sample_as_dict(parameters_set_1):
     assert sample_dict == {"x1": 0.5, "x2_0": 0.1, "x2_1": 0.6}
 
 
+def test_sample_as_dict_wrong_size(parameters_set_1):
+    """Test *sample_as_dict* method for a sample of wrong size."""
+    with pytest.raises(ValueError):
+        parameters_set_1.sample_as_dict(np.array([0.5, 0.1]))
+
+
 def test_dict_as_sample(parameters_set_1):
     """Test *dict_as_sample* method."""
     sample_dict = {"x2_0": 0.1, "x2_1": 0.6, "x1": 0.5}  # ordering does not matter
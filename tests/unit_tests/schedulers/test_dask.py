@@ -0,0 +1,87 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Unit tests for the result caching of the Dask schedulers."""
+
+import numpy as np
+import pytest
+
+from queens.schedulers import Local
+
+
+class JobIdFunction:
+    """Function returning the job id with which it was evaluated.
+
+    Attributes:
+        offset (float): Offset added to the sample sum
+    """
+
+    def __init__(self, offset):
+        """Initialize the function.
+
+        Args:
+            offset (float): Offset added to the sample sum
+        """
+        self.offset = offset
+
+    def __call__(self, sample, job_id, num_procs, experiment_dir, experiment_name):
+        """Evaluate the function.
+
+        Args:
+            sample (np.array): Sample
+            job_id (int): Job id
+            num_procs (int): Number of processors
+            experiment_dir (Path): Path to QUEENS experiment directory
+            experiment_name (str): Name of the QUEENS experiment
+
+        Returns:
+            result (dict): Result and job id of the evaluation
+        """
+        return {"result": np.sum(sample) + self.offset, "job_id": job_id}
+
+
+@pytest.fixture(name="caching_scheduler")
+def fixture_caching_scheduler(tmp_path, test_name):
+    """Local scheduler with result caching."""
+    scheduler = Local(
+        experiment_name=test_name,
+        experiment_base_dir=tmp_path,
+        cache_results=True,
+        max_cached_results=3,
+    )
+    yield scheduler
+    scheduler.shutdown_client()
+
+
+def test_cache_results(caching_scheduler):
+    """Test reuse and order of cached results."""
+    samples = np.array([[1.0, 0.0], [2.0, 0.0], [3.0, 0.0]])
+    function = JobIdFunction(offset=0.0)
+
+    results = caching_scheduler.evaluate(samples[:2], function, job_ids=[1, 2])
+    assert [result["job_id"] for result in results] == [1, 2]
+
+    # Recurring samples are served from the cache and returned in the order of the samples
+    results = caching_scheduler.evaluate(samples[[1, 2, 0]], function, job_ids=[3, 4, 5])
+    assert [result["result"] for result in results] == [2.0, 3.0, 1.0]
+    assert [result["job_id"] for result in results] == [2, 4, 1]
+
+    # A function with the same configuration reuses the results, a different one does not
+    results = caching_scheduler.evaluate(samples[:1], JobIdFunction(offset=0.0), job_ids=[6])
+    assert results[0]["job_id"] == 1
+    results = caching_scheduler.evaluate(samples[:1], JobIdFunction(offset=1.0), job_ids=[7])
+    assert results[0] == {"result": 2.0, "job_id": 7}
+
+    # Only the most recently used results are kept alive
+    assert len(caching_scheduler.cached_futures) == 3
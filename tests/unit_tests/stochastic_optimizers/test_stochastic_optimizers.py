@@ -67,6 +67,45 @@ def test_sgd(sgd_optimizer):
     assert np.mean(result - 0.5) < 0.005
 
 
+def test_mixed_dtypes(adam_optimizer):
+    """Test that a float32 gradient does not downcast float64 parameters."""
+    varparams = np.ones(5)
+    adam_optimizer.current_variational_parameters = varparams
+    adam_optimizer.set_gradient_function(lambda x: gradient(x).astype(np.float32))
+    result = next(adam_optimizer)
+    assert result.dtype == np.float64
+    np.testing.assert_array_equal(varparams, np.ones(5))
+
+
+def test_clip_gradient():
+    """Test clipping the gradient by value and then by norm."""
+    optimizer = SGD(
+        learning_rate=1e-2,
+        optimization_type="max",
+        rel_l1_change_threshold=1e-4,
+        rel_l2_change_threshold=1e-6,
+        clip_by_l2_norm_threshold=1.0,
+        clip_by_value_threshold=2.0,
+    )
+    gradient = np.array([np.nan, 3.0, -4.0, 0.0])
+    clipped_gradient = optimizer.clip_gradient(gradient)
+
+    expected_gradient = np.array([0.0, 2.0, -2.0, 0.0]) / np.sqrt(8.0)
+    np.testing.assert_allclose(clipped_gradient, expected_gradient)
+    np.testing.assert_array_equal(gradient, np.array([np.nan, 3.0, -4.0, 0.0]))
+
+
+def test_clip_gradient_infinite_thresholds(sgd_optimizer):
+    """Test that infinite clipping thresholds only zero non-finite components."""
+    gradient = np.array([np.nan, 1e300, -np.inf, 0.5])
+    clipped_gradient = sgd_optimizer.clip_gradient(gradient)
+
+    np.testing.assert_array_equal(clipped_gradient, np.nan_to_num(gradient))
+    np.testing.assert_array_equal(
+        sgd_optimizer.clip_gradient(np.array([1e300, -2.0])), np.array([1e300, -2.0])
+    )
+
+
 @pytest.fixture(name="sgd_optimizer")
 def fixture_sgd_optimizer():
     """An SGD optimizer."""
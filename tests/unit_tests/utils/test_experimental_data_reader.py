@@ -0,0 +1,47 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Unit tests for the experimental data reader."""
+
+import numpy as np
+
+from queens.data_processors.csv_file import CsvFile
+from queens.data_processors.numpy_file import NumpyFile
+from queens.utils.experimental_data_reader import ExperimentalDataReader
+
+
+def test_default_data_processor():
+    """Test that a csv data processor is used by default."""
+    reader = ExperimentalDataReader(output_label="y", file_name_identifier="data.csv")
+    assert isinstance(reader.data_processor, CsvFile)
+    assert reader.data_processor.file_name_identifier == "data.csv"
+
+
+def test_custom_data_processor(tmp_path):
+    """Test that a passed data processor is used to read the experimental data."""
+    np.savez(tmp_path / "experimental_data.npz", x=[0.0, 1.0], t=[1.0, 1.0], y=[2.0, 3.0])
+    data_processor = NumpyFile(file_name_identifier="experimental_data.npz", file_options_dict={})
+    reader = ExperimentalDataReader(
+        data_processor=data_processor,
+        output_label="y",
+        coordinate_labels=["x"],
+        time_label="t",
+        csv_data_base_dir=tmp_path,
+    )
+    assert reader.data_processor is data_processor
+
+    y_obs, coordinates, time_vec, *_ = reader.get_experimental_data()
+    np.testing.assert_array_equal(y_obs, [2.0, 3.0])
+    np.testing.assert_array_equal(coordinates, [[0.0], [1.0]])
+    np.testing.assert_array_equal(time_vec, [1.0])
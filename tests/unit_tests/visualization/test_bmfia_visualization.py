@@ -0,0 +1,71 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Unit tests for the BMFIA visualization."""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.axes import Axes
+
+from queens.visualization.bmfia_visualization import BMFIAVisualization
+
+
+@pytest.fixture(name="dummy_vis")
+def fixture_dummy_vis(tmp_path):
+    """Generate dummy instance of class BMFIAVisualization."""
+    paths = [tmp_path / name for name in ["manifold.png", "posterior.png"]]
+    return BMFIAVisualization(paths, save_bools=[False, True], plot_booleans=[False, True])
+
+
+@pytest.fixture(name="posterior_samples")
+def fixture_posterior_samples():
+    """Weighted posterior samples."""
+    samples = np.random.default_rng(seed=42).uniform(size=(200, 2))
+    weights = np.linspace(1.0, 2.0, 200)
+    return samples, weights
+
+
+def test_plot_posterior_from_samples(dummy_vis, posterior_samples, mocker):
+    """Test that the weighted posterior plot is saved and closed."""
+    hexbin = mocker.spy(Axes, "hexbin")
+    samples, weights = posterior_samples
+    dummy_vis.plot_posterior_from_samples(samples, weights, ["x", "y"])
+
+    assert dummy_vis.paths[1].is_file()
+    assert not plt.get_fignums()
+    _, x, y = hexbin.call_args.args
+    np.testing.assert_array_equal(np.column_stack((x, y)), samples)
+    np.testing.assert_array_equal(hexbin.call_args.kwargs["C"], weights)
+
+
+def test_plot_posterior_from_samples_resampling(dummy_vis, posterior_samples, mocker):
+    """Test that large sample sets are resampled deterministically."""
+    hexbin = mocker.spy(Axes, "hexbin")
+    samples, weights = posterior_samples
+    max_num_samples = 50
+
+    plotted_samples = []
+    for _ in range(2):
+        dummy_vis.plot_posterior_from_samples(
+            samples, weights, ["x", "y"], max_num_samples=max_num_samples
+        )
+        _, x, y = hexbin.call_args.args
+        plotted_samples.append(np.column_stack((x, y)))
+        assert hexbin.call_args.kwargs["C"] is None
+
+    assert plotted_samples[0].shape == (max_num_samples, 2)
+    np.testing.assert_array_equal(plotted_samples[0], plotted_samples[1])
+    assert np.isin(plotted_samples[0], samples).all()
+    assert not plt.get_fignums()